@@ -105,6 +105,7 @@ BACKEND_ATTRIBUTES = {
         'std',
         'sum',
         'tan',
+        'take',
         'tanh',
         'tile',
         'to_numpy',
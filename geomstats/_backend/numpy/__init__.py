@@ -83,6 +83,7 @@ from autograd.numpy import (  # NOQA
     stack,
     std,
     sum,
+    take,
     tan,
     tanh,
     tile,
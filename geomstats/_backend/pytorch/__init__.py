@@ -518,6 +518,18 @@ def triu_indices(n, k=0, m=None):
     return torch.triu_indices(row=n, col=m, offset=k)
 
 
+def take(a, indices, axis=None):
+    if not torch.is_tensor(indices):
+        indices = torch.as_tensor(indices)
+    if axis is None:
+        a = torch.flatten(a)
+        axis = 0
+    axis = axis % a.ndim
+    taken = torch.index_select(a, axis, torch.flatten(indices))
+    return torch.reshape(
+        taken, a.shape[:axis] + indices.shape + a.shape[axis + 1:])
+
+
 def tile(x, y):
     if not torch.is_tensor(x):
         x = torch.tensor(x)
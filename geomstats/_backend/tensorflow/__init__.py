@@ -791,6 +791,13 @@ def triu_to_vec(x, k=0):
     return tf.boolean_mask(x, mask, axis=axis)
 
 
+def take(a, indices, axis=None):
+    if axis is None:
+        a = tf.reshape(a, [-1])
+        axis = 0
+    return tf.gather(a, indices, axis=axis)
+
+
 def tile(x, multiples):
     t1 = tf.ones(len(multiples) - len(tf.shape(x)))
     t1 = tf.cast(t1, tf.int32)
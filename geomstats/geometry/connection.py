@@ -505,10 +505,8 @@ class Connection(ABC):
             initial_tangent_vec = gs.to_ndarray(
                 initial_tangent_vec, to_ndim=3)
         n_initial_conditions = initial_tangent_vec.shape[0]
-
-        if n_initial_conditions > 1 and len(initial_point) == 1:
-            initial_point = gs.stack(
-                [initial_point[0]] * n_initial_conditions)
+        is_shared_initial_point = (
+            n_initial_conditions > 1 and len(initial_point) == 1)
 
         def path(t):
             """Generate parameterized function for geodesic curve.
@@ -528,10 +526,20 @@ class Connection(ABC):
                 tangent_vecs = gs.einsum(
                     'i,...kl->...ikl', t, initial_tangent_vec)
 
-            points_at_time_t = [
-                self.exp(tv, pt) for tv,
-                pt in zip(tangent_vecs, initial_point)]
-            points_at_time_t = gs.stack(points_at_time_t, axis=0)
+            if is_shared_initial_point:
+                # Compute all the exponentials from the common initial point
+                # at once
+                flat_tangent_vecs = gs.reshape(
+                    tangent_vecs, (-1, ) + tuple(tangent_vecs.shape[2:]))
+                points_at_time_t = self.exp(
+                    flat_tangent_vecs, initial_point[0])
+                points_at_time_t = gs.reshape(
+                    points_at_time_t, tangent_vecs.shape)
+            else:
+                points_at_time_t = [
+                    self.exp(tv, pt) for tv,
+                    pt in zip(tangent_vecs, initial_point)]
+                points_at_time_t = gs.stack(points_at_time_t, axis=0)
 
             return points_at_time_t[0] if n_initial_conditions == 1 else \
                 points_at_time_t
@@ -73,7 +73,10 @@ class L2Metric(ProductRiemannianMetric):
         Returns
         -------
         path : callable
-            Time parameterized geodesic curve.
+            Time parameterized geodesic curve. If a batch of initial
+            conditions is passed, the output array's first dimension
+            represents the different initial conditions, and the second
+            corresponds to time.
         """
         landmarks_ndim = 2
         initial_landmarks = gs.to_ndarray(
@@ -98,30 +101,27 @@ class L2Metric(ProductRiemannianMetric):
         initial_tangent_vec = gs.to_ndarray(
             initial_tangent_vec, to_ndim=landmarks_ndim + 1)
 
+        n_initial_conditions = initial_tangent_vec.shape[0]
+
         def landmarks_on_geodesic(t):
-            t = gs.cast(t, gs.float32)
+            t = gs.cast(t, initial_tangent_vec.dtype)
             t = gs.to_ndarray(t, to_ndim=1)
-            t = gs.to_ndarray(t, to_ndim=2, axis=1)
-            new_initial_landmarks = gs.to_ndarray(
-                initial_landmarks, to_ndim=landmarks_ndim + 1)
-            new_initial_tangent_vec = gs.to_ndarray(
-                initial_tangent_vec, to_ndim=landmarks_ndim + 1)
-
-            tangent_vecs = gs.einsum('il,nkm->ikm', t, new_initial_tangent_vec)
-
-            def point_on_landmarks(tangent_vec):
-                if gs.ndim(tangent_vec) < 2:
-                    raise RuntimeError
-                exp = self.exp(
-                    tangent_vec=tangent_vec,
-                    base_point=new_initial_landmarks)
-                return exp
-
-            landmarks_at_time_t = gs.vectorize(
-                tangent_vecs,
-                point_on_landmarks,
-                signature='(i,j)->(i,j)')
-
-            return landmarks_at_time_t
+
+            tangent_vecs = gs.einsum('i,...kl->...ikl', t, initial_tangent_vec)
+
+            # Compute the exponentials at all times and for all initial
+            # conditions at once
+            flat_tangent_vecs = gs.reshape(
+                tangent_vecs, (-1, ) + tuple(tangent_vecs.shape[2:]))
+            base_points = initial_landmarks
+            if len(initial_landmarks) > 1:
+                base_points = gs.repeat(initial_landmarks, t.shape[0], 0)
+            landmarks_at_time_t = self.exp(
+                tangent_vec=flat_tangent_vecs, base_point=base_points)
+            landmarks_at_time_t = gs.reshape(
+                landmarks_at_time_t, tangent_vecs.shape)
+
+            return landmarks_at_time_t[0] if n_initial_conditions == 1 else \
+                landmarks_at_time_t
 
         return landmarks_on_geodesic
@@ -92,7 +92,7 @@ class SPDMatrices(OpenSet):
         size = (n_samples, n, n) if n_samples != 1 else (n, n)
 
         mat = bound * (2 * gs.random.rand(*size) - 1)
-        spd_mat = GeneralLinear.exp(Matrices.to_symmetric(mat))
+        spd_mat = SymmetricMatrices.expm(Matrices.to_symmetric(mat))
 
         return spd_mat
 
@@ -119,10 +119,11 @@ class SPDMatrices(OpenSet):
         if base_point is None:
             base_point = gs.eye(n)
 
-        sqrt_base_point = gs.linalg.sqrtm(base_point)
+        sqrt_base_point = SymmetricMatrices.powerm(base_point, 1. / 2)
 
         tangent_vec_at_id = 2 * gs.random.rand(*size) - 1
         tangent_vec_at_id += Matrices.transpose(tangent_vec_at_id)
+        tangent_vec_at_id = gs.cast(tangent_vec_at_id, base_point.dtype)
 
         tangent_vec = Matrices.mul(
             sqrt_base_point, tangent_vec_at_id, sqrt_base_point)
@@ -130,7 +131,7 @@ class SPDMatrices(OpenSet):
         return tangent_vec
 
     @staticmethod
-    def aux_differential_power(power, tangent_vec, base_point):
+    def aux_differential_power(power, tangent_vec, base_point, eigh=None):
         """Compute the differential of the matrix power.
 
         Auxiliary function to the functions differential_power and
@@ -144,6 +145,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -153,7 +158,9 @@ class SPDMatrices(OpenSet):
         denominator : array-like, shape=[..., n, n]
         temp_result : array-like, shape=[..., n, n]
         """
-        eigvalues, eigvectors = gs.linalg.eigh(base_point)
+        if eigh is None:
+            eigh = gs.linalg.eigh(base_point)
+        eigvalues, eigvectors = eigh
 
         if power == 0:
             powered_eigvalues = gs.log(eigvalues)
@@ -166,23 +173,33 @@ class SPDMatrices(OpenSet):
         numerator = (
             powered_eigvalues[..., :, None] - powered_eigvalues[..., None, :])
 
+        # Eigenvalues that coincide up to numerical noise, relative to their
+        # magnitude, use the derivative instead of the ill-conditioned
+        # divided difference. The exponential cancels in absolute terms, so
+        # its gaps are compared to at least one.
+        abs_eigvalues = gs.abs(eigvalues)
+        scale = gs.maximum(
+            abs_eigvalues[..., :, None], abs_eigvalues[..., None, :])
+        if power == math.inf:
+            scale = gs.maximum(scale, gs.ones_like(scale))
+        is_close = gs.abs(denominator) <= gs.rtol * scale
         if power == 0:
             numerator = gs.where(
-                denominator == 0, gs.ones_like(numerator), numerator)
+                is_close, gs.ones_like(numerator), numerator)
             denominator = gs.where(
-                denominator == 0, eigvalues[..., :, None], denominator)
+                is_close, eigvalues[..., :, None], denominator)
         elif power == math.inf:
             numerator = gs.where(
-                denominator == 0, powered_eigvalues[..., :, None], numerator)
+                is_close, powered_eigvalues[..., :, None], numerator)
             denominator = gs.where(
-                denominator == 0, gs.ones_like(numerator), denominator)
+                is_close, gs.ones_like(numerator), denominator)
         else:
             numerator = gs.where(
-                denominator == 0,
+                is_close,
                 power * powered_eigvalues[..., :, None],
                 numerator)
             denominator = gs.where(
-                denominator == 0,
+                is_close,
                 eigvalues[..., :, None],
                 denominator)
 
@@ -193,7 +210,7 @@ class SPDMatrices(OpenSet):
             eigvectors, transp_eigvectors, numerator, denominator, temp_result)
 
     @classmethod
-    def differential_power(cls, power, tangent_vec, base_point):
+    def differential_power(cls, power, tangent_vec, base_point, eigh=None):
         r"""Compute the differential of the matrix power function.
 
         Compute the differential of the power function on SPD(n)
@@ -207,6 +224,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -214,14 +235,15 @@ class SPDMatrices(OpenSet):
             Differential of the power function.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result =\
-            cls.aux_differential_power(power, tangent_vec, base_point)
+            cls.aux_differential_power(power, tangent_vec, base_point, eigh)
         power_operator = numerator / denominator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
         return result
 
     @classmethod
-    def inverse_differential_power(cls, power, tangent_vec, base_point):
+    def inverse_differential_power(
+            cls, power, tangent_vec, base_point, eigh=None):
         r"""Compute the inverse of the differential of the matrix power.
 
         Compute the inverse of the differential of the power
@@ -236,6 +258,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -243,14 +269,14 @@ class SPDMatrices(OpenSet):
             Inverse of the differential of the power function.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result =\
-            cls.aux_differential_power(power, tangent_vec, base_point)
+            cls.aux_differential_power(power, tangent_vec, base_point, eigh)
         power_operator = denominator / numerator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
         return result
 
     @classmethod
-    def differential_log(cls, tangent_vec, base_point):
+    def differential_log(cls, tangent_vec, base_point, eigh=None):
         """Compute the differential of the matrix logarithm.
 
         Compute the differential of the matrix logarithm on SPD
@@ -262,6 +288,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -269,14 +299,14 @@ class SPDMatrices(OpenSet):
             Differential of the matrix logarithm.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result =\
-            cls.aux_differential_power(0, tangent_vec, base_point)
+            cls.aux_differential_power(0, tangent_vec, base_point, eigh)
         power_operator = numerator / denominator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
         return result
 
     @classmethod
-    def inverse_differential_log(cls, tangent_vec, base_point):
+    def inverse_differential_log(cls, tangent_vec, base_point, eigh=None):
         """Compute the inverse of the differential of the matrix logarithm.
 
         Compute the inverse of the differential of the matrix
@@ -289,6 +319,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -296,14 +330,14 @@ class SPDMatrices(OpenSet):
             Inverse of the differential of the matrix logarithm.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result =\
-            cls.aux_differential_power(0, tangent_vec, base_point)
+            cls.aux_differential_power(0, tangent_vec, base_point, eigh)
         power_operator = denominator / numerator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
         return result
 
     @classmethod
-    def differential_exp(cls, tangent_vec, base_point):
+    def differential_exp(cls, tangent_vec, base_point, eigh=None):
         """Compute the differential of the matrix exponential.
 
         Computes the differential of the matrix exponential on SPD
@@ -315,6 +349,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -322,14 +360,14 @@ class SPDMatrices(OpenSet):
             Differential of the matrix exponential.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result = \
-            cls.aux_differential_power(math.inf, tangent_vec, base_point)
+            cls.aux_differential_power(math.inf, tangent_vec, base_point, eigh)
         power_operator = numerator / denominator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
         return result
 
     @classmethod
-    def inverse_differential_exp(cls, tangent_vec, base_point):
+    def inverse_differential_exp(cls, tangent_vec, base_point, eigh=None):
         """Compute the inverse of the differential of the matrix exponential.
 
         Computes the inverse of the differential of the matrix
@@ -342,6 +380,10 @@ class SPDMatrices(OpenSet):
             Tangent vector at base point.
         base_point : array_like, shape=[..., n, n]
             Base point.
+        eigh : tuple of array-like, optional
+            Eigenvalues and eigenvectors of base_point, as returned by
+            gs.linalg.eigh.
+            Optional, default: None, in which case they are computed.
 
         Returns
         -------
@@ -349,7 +391,7 @@ class SPDMatrices(OpenSet):
             Inverse of the differential of the matrix exponential.
         """
         eigvectors, transp_eigvectors, numerator, denominator, temp_result = \
-            cls.aux_differential_power(math.inf, tangent_vec, base_point)
+            cls.aux_differential_power(math.inf, tangent_vec, base_point, eigh)
         power_operator = denominator / numerator
         result = power_operator * temp_result
         result = Matrices.mul(eigvectors, result, transp_eigvectors)
@@ -426,7 +468,10 @@ class SPDMetricAffine(RiemannianMetric):
         inner_product : array-like, shape=[...]
         """
         aux_a = Matrices.mul(inv_base_point, tangent_vec_a)
-        aux_b = Matrices.mul(inv_base_point, tangent_vec_b)
+        # Squared norms pass the same tangent vector twice
+        aux_b = aux_a
+        if tangent_vec_b is not tangent_vec_a:
+            aux_b = Matrices.mul(inv_base_point, tangent_vec_b)
 
         # Use product instead of matrix product and trace to save time
         inner_product = Matrices.trace_product(aux_a, aux_b)
@@ -461,10 +506,15 @@ class SPDMetricAffine(RiemannianMetric):
             inner_product = self._aux_inner_product(
                 tangent_vec_a, tangent_vec_b, inv_base_point)
         else:
+            eigh = gs.linalg.eigh(base_point)
             modified_tangent_vec_a = spd_space.differential_power(
-                power_affine, tangent_vec_a, base_point)
-            modified_tangent_vec_b = spd_space.differential_power(
-                power_affine, tangent_vec_b, base_point)
+                power_affine, tangent_vec_a, base_point, eigh)
+            # Keep passing a single object for squared norms, so that
+            # _aux_inner_product also reuses its product
+            modified_tangent_vec_b = modified_tangent_vec_a
+            if tangent_vec_b is not tangent_vec_a:
+                modified_tangent_vec_b = spd_space.differential_power(
+                    power_affine, tangent_vec_b, base_point, eigh)
             power_inv_base_point = SymmetricMatrices.powerm(
                 base_point, -power_affine)
             inner_product = self._aux_inner_product(
@@ -477,27 +527,29 @@ class SPDMetricAffine(RiemannianMetric):
         return inner_product
 
     @staticmethod
-    def _aux_exp(tangent_vec, sqrt_base_point, inv_sqrt_base_point):
+    def _aux_exp(tangent_vec, factor, inv_factor):
         """Compute the exponential map (auxiliary function).
 
+        The base point is given by a factor :math: `F` such that
+        :math: `FF^T` is the base point, e.g. its square root or its
+        Cholesky factor.
+
         Parameters
         ----------
         tangent_vec : array-like, shape=[..., n, n]
-        sqrt_base_point : array-like, shape=[..., n, n]
-        inv_sqrt_base_point : array-like, shape=[..., n, n]
+        factor : array-like, shape=[..., n, n]
+        inv_factor : array-like, shape=[..., n, n]
 
         Returns
         -------
         exp : array-like, shape=[..., n, n]
         """
-        tangent_vec_at_id = Matrices.mul(
-            inv_sqrt_base_point, tangent_vec, inv_sqrt_base_point)
+        tangent_vec_at_id = Matrices.congruent(tangent_vec, inv_factor)
 
         tangent_vec_at_id = Matrices.to_symmetric(tangent_vec_at_id)
         exp_from_id = SymmetricMatrices.expm(tangent_vec_at_id)
 
-        exp = Matrices.mul(
-            sqrt_base_point, exp_from_id, sqrt_base_point)
+        exp = Matrices.congruent(exp_from_id, factor)
         return exp
 
     def exp(self, tangent_vec, base_point, **kwargs):
@@ -522,9 +574,11 @@ class SPDMetricAffine(RiemannianMetric):
         power_affine = self.power_affine
 
         if power_affine == 1:
-            powers = SymmetricMatrices.powerm(base_point, [1. / 2, -1. / 2])
+            cholesky_factor = gs.linalg.cholesky(base_point)
             exp = self._aux_exp(
-                tangent_vec, powers[0], powers[1])
+                tangent_vec,
+                cholesky_factor,
+                GeneralLinear.inverse(cholesky_factor))
         else:
             modified_tangent_vec = SPDMatrices.differential_power(
                 power_affine, tangent_vec, base_point)
@@ -541,25 +595,28 @@ class SPDMetricAffine(RiemannianMetric):
         return exp
 
     @staticmethod
-    def _aux_log(point, sqrt_base_point, inv_sqrt_base_point):
+    def _aux_log(point, factor, inv_factor):
         """Compute the log (auxiliary function).
 
+        The base point is given by a factor :math: `F` such that
+        :math: `FF^T` is the base point, e.g. its square root or its
+        Cholesky factor.
+
         Parameters
         ----------
         point : array-like, shape=[..., n, n]
-        sqrt_base_point : array-like, shape=[..., n, n]
-        inv_sqrt_base_point : array-like, shape=[.., n, n]
+        factor : array-like, shape=[..., n, n]
+        inv_factor : array-like, shape=[.., n, n]
 
         Returns
         -------
         log : array-like, shape=[..., n, n]
         """
-        point_near_id = Matrices.mul(
-            inv_sqrt_base_point, point, inv_sqrt_base_point)
+        point_near_id = Matrices.congruent(point, inv_factor)
         point_near_id = Matrices.to_symmetric(point_near_id)
 
         log_at_id = SPDMatrices.logm(point_near_id)
-        log = Matrices.mul(sqrt_base_point, log_at_id, sqrt_base_point)
+        log = Matrices.congruent(log_at_id, factor)
         return log
 
     def log(self, point, base_point, **kwargs):
@@ -584,8 +641,9 @@ class SPDMetricAffine(RiemannianMetric):
         power_affine = self.power_affine
 
         if power_affine == 1:
-            powers = SymmetricMatrices.powerm(base_point, [1. / 2, -1. / 2])
-            log = self._aux_log(point, powers[0], powers[1])
+            cholesky_factor = gs.linalg.cholesky(base_point)
+            log = self._aux_log(
+                point, cholesky_factor, GeneralLinear.inverse(cholesky_factor))
         else:
             power_point = SymmetricMatrices.powerm(point, power_affine)
             powers = SymmetricMatrices.powerm(
@@ -812,10 +870,11 @@ class SPDMetricEuclidean(RiemannianMetric):
             inner_product = Matrices.frobenius_product(
                 tangent_vec_a, tangent_vec_b)
         else:
+            eigh = gs.linalg.eigh(base_point)
             modified_tangent_vec_a = spd_space.differential_power(
-                power_euclidean, tangent_vec_a, base_point)
+                power_euclidean, tangent_vec_a, base_point, eigh)
             modified_tangent_vec_b = spd_space.differential_power(
-                power_euclidean, tangent_vec_b, base_point)
+                power_euclidean, tangent_vec_b, base_point, eigh)
 
             inner_product = Matrices.frobenius_product(
                 modified_tangent_vec_a, modified_tangent_vec_b
@@ -899,10 +958,11 @@ class SPDMetricLogEuclidean(RiemannianMetric):
         """
         spd_space = SPDMatrices
 
+        eigh = gs.linalg.eigh(base_point)
         modified_tangent_vec_a = spd_space.differential_log(
-            tangent_vec_a, base_point)
+            tangent_vec_a, base_point, eigh)
         modified_tangent_vec_b = spd_space.differential_log(
-            tangent_vec_b, base_point)
+            tangent_vec_b, base_point, eigh)
         product = Matrices.trace_product(
             modified_tangent_vec_a, modified_tangent_vec_b)
         return product
@@ -4,7 +4,6 @@ import logging
 
 import geomstats.backend as gs
 import geomstats.vectorization
-from geomstats import algebra_utils
 from geomstats.geometry.base import VectorSpace
 from geomstats.geometry.matrices import Matrices, MatricesMetric
 
@@ -141,13 +140,18 @@ class SymmetricMatrices(VectorSpace):
             raise ValueError('Invalid input dimension, it must be of the form'
                              '(n_samples, n * (n + 1) / 2)')
         mat_dim = int(mat_dim)
-        shape = (mat_dim, mat_dim)
-        mask = 2 * gs.ones(shape) - gs.eye(mat_dim)
-        indices = list(zip(*gs.triu_indices(mat_dim)))
+
+        # Coefficient (i, j) of the matrix is read from the entry of the
+        # vector holding the upper triangular coefficient (min, max)
+        indices = []
+        for i in range(mat_dim):
+            for j in range(mat_dim):
+                row, col = min(i, j), max(i, j)
+                indices.append(
+                    row * mat_dim - row * (row - 1) // 2 + col - row)
         vec = gs.cast(vec, dtype)
-        upper_triangular = gs.stack([
-            gs.array_from_sparse(indices, data, shape) for data in vec])
-        mat = Matrices.to_symmetric(upper_triangular) * mask
+        mat = gs.take(vec, indices, axis=-1)
+        mat = gs.reshape(mat, tuple(vec.shape[:-1]) + (mat_dim, mat_dim))
         return mat
 
     @classmethod
@@ -230,7 +234,7 @@ class SymmetricMatrices(VectorSpace):
         transp_eigvecs = Matrices.transpose(eigvecs)
         for fun in function:
             eigvals_f = fun(eigvals)
-            eigvals_f = algebra_utils.from_vector_to_diagonal_matrix(eigvals_f)
+            scaled_eigvecs = gs.einsum('...ij,...j->...ij', eigvecs, eigvals_f)
             reconstruction.append(
-                Matrices.mul(eigvecs, eigvals_f, transp_eigvecs))
+                Matrices.mul(scaled_eigvecs, transp_eigvecs))
         return reconstruction if return_list else reconstruction[0]
@@ -26,6 +26,9 @@ def np_backend():
     return os.environ['GEOMSTATS_BACKEND'] == 'numpy'
 
 
+# The decorators below select the backend when the test module is imported:
+# they return the test unchanged or skipped, so running a test does not
+# re-evaluate the backend.
 def np_only(test_item):
     """Decorate to filter tests for numpy only."""
     if np_backend():
@@ -1003,6 +1003,19 @@ class TestBackends(geomstats.tests.TestCase):
         self.assertAllClose(result[0], value.detach())
         self.assertAllClose(result[1], grad)
 
+    def test_take(self):
+        vec = gs.array([[1., 2., 3.], [4., 5., 6.]])
+        np_vec = _np.array([[1., 2., 3.], [4., 5., 6.]])
+        indices = [0, 2, 2, 1]
+
+        result = gs.take(vec, indices, axis=-1)
+        expected = _np.take(np_vec, indices, axis=-1)
+        self.assertAllCloseToNp(result, expected)
+
+        result = gs.take(vec, indices)
+        expected = _np.take(np_vec, indices)
+        self.assertAllCloseToNp(result, expected)
+
     def test_mat_from_diag_triu_tril(self):
 
         diag = gs.array([9., 9., 9.])
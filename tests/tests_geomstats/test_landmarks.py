@@ -1,5 +1,7 @@
 """Unit tests for landmarks space."""
 
+import functools
+
 import geomstats.backend as gs
 import geomstats.tests
 from geomstats.geometry.hypersphere import Hypersphere
@@ -8,7 +10,9 @@ from geomstats.geometry.landmarks import Landmarks
 
 class TestLandmarks(geomstats.tests.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        super(TestLandmarks, cls).setUpClass()
         s2 = Hypersphere(dim=2)
         r3 = s2.embedding_space
 
@@ -27,24 +31,36 @@ class TestLandmarks(geomstats.tests.TestCase):
             initial_point=initial_point,
             initial_tangent_vec=initial_tangent_vec_c)
 
-        self.n_sampling_points = 10
-        sampling_times = gs.linspace(0., 1., self.n_sampling_points)
+        cls.n_sampling_points = 10
+        sampling_times = gs.linspace(0., 1., cls.n_sampling_points)
         landmark_set_a = landmarks_a(sampling_times)
         landmark_set_b = landmarks_b(sampling_times)
         landmark_set_c = landmarks_c(sampling_times)
 
-        self.n_landmark_sets = 5
-        self.times = gs.linspace(0., 1., self.n_landmark_sets)
+        cls.n_landmark_sets = 5
+        cls.times = gs.linspace(0., 1., cls.n_landmark_sets)
+        cls.space_landmarks_in_euclidean_3d = Landmarks(
+            ambient_manifold=r3, k_landmarks=cls.n_sampling_points)
+        cls.space_landmarks_in_sphere_2d = Landmarks(
+            ambient_manifold=s2, k_landmarks=cls.n_sampling_points)
+        cls.l2_metric_s2 = cls.space_landmarks_in_sphere_2d.metric
+        cls.l2_metric_r3 = cls.space_landmarks_in_euclidean_3d.metric
+        cls.landmarks_a = landmark_set_a
+        cls.landmarks_b = landmark_set_b
+        cls.landmarks_c = landmark_set_c
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _landmarks_ab_and_bc(cls):
+        """Compute the geodesics from a to b and from b to c at times."""
+        geodesics = cls.l2_metric_s2.geodesic(
+            initial_point=gs.stack([cls.landmarks_a, cls.landmarks_b]),
+            end_point=gs.stack([cls.landmarks_b, cls.landmarks_c]))
+        landmarks = geodesics(cls.times)
+        return landmarks[0], landmarks[1]
+
+    def setUp(self):
         gs.random.seed(1234)
-        self.space_landmarks_in_euclidean_3d = Landmarks(
-            ambient_manifold=r3, k_landmarks=self.n_sampling_points)
-        self.space_landmarks_in_sphere_2d = Landmarks(
-            ambient_manifold=s2, k_landmarks=self.n_sampling_points)
-        self.l2_metric_s2 = self.space_landmarks_in_sphere_2d.metric
-        self.l2_metric_r3 = self.space_landmarks_in_euclidean_3d.metric
-        self.landmarks_a = landmark_set_a
-        self.landmarks_b = landmark_set_b
-        self.landmarks_c = landmark_set_c
 
     def test_belongs(self):
         result = self.space_landmarks_in_sphere_2d.belongs(self.landmarks_a)
@@ -83,12 +99,7 @@ class TestLandmarks(geomstats.tests.TestCase):
     def test_l2_metric_inner_product_vectorization(self):
         """Test the vectorization inner_product."""
         n_samples = self.n_landmark_sets
-        landmarks_ab = self.l2_metric_s2.geodesic(
-            self.landmarks_a, self.landmarks_b)
-        landmarks_bc = self.l2_metric_s2.geodesic(
-            self.landmarks_b, self.landmarks_c)
-        landmarks_ab = landmarks_ab(self.times)
-        landmarks_bc = landmarks_bc(self.times)
+        landmarks_ab, landmarks_bc = self._landmarks_ab_and_bc()
 
         tangent_vecs = self.l2_metric_s2.log(
             point=landmarks_bc, base_point=landmarks_ab)
@@ -102,12 +113,7 @@ class TestLandmarks(geomstats.tests.TestCase):
     def test_l2_metric_dist_vectorization(self):
         """Test the vectorization of dist."""
         n_samples = self.n_landmark_sets
-        landmarks_ab = self.l2_metric_s2.geodesic(
-            self.landmarks_a, self.landmarks_b)
-        landmarks_bc = self.l2_metric_s2.geodesic(
-            self.landmarks_b, self.landmarks_c)
-        landmarks_ab = landmarks_ab(self.times)
-        landmarks_bc = landmarks_bc(self.times)
+        landmarks_ab, landmarks_bc = self._landmarks_ab_and_bc()
 
         result = self.l2_metric_s2.dist(
             landmarks_ab, landmarks_bc)
@@ -116,12 +122,7 @@ class TestLandmarks(geomstats.tests.TestCase):
     @geomstats.tests.np_and_tf_only
     def test_l2_metric_exp_vectorization(self):
         """Test the vectorization of exp."""
-        landmarks_ab = self.l2_metric_s2.geodesic(
-            self.landmarks_a, self.landmarks_b)
-        landmarks_bc = self.l2_metric_s2.geodesic(
-            self.landmarks_b, self.landmarks_c)
-        landmarks_ab = landmarks_ab(self.times)
-        landmarks_bc = landmarks_bc(self.times)
+        landmarks_ab, landmarks_bc = self._landmarks_ab_and_bc()
 
         tangent_vecs = self.l2_metric_s2.log(
             point=landmarks_bc, base_point=landmarks_ab)
@@ -133,12 +134,7 @@ class TestLandmarks(geomstats.tests.TestCase):
     @geomstats.tests.np_and_tf_only
     def test_l2_metric_log_vectorization(self):
         """Test the vectorization of log."""
-        landmarks_ab = self.l2_metric_s2.geodesic(
-            self.landmarks_a, self.landmarks_b)
-        landmarks_bc = self.l2_metric_s2.geodesic(
-            self.landmarks_b, self.landmarks_c)
-        landmarks_ab = landmarks_ab(self.times)
-        landmarks_bc = landmarks_bc(self.times)
+        landmarks_ab, landmarks_bc = self._landmarks_ab_and_bc()
 
         tangent_vecs = self.l2_metric_s2.log(
             point=landmarks_bc, base_point=landmarks_ab)
@@ -146,6 +142,18 @@ class TestLandmarks(geomstats.tests.TestCase):
         result = tangent_vecs
         self.assertAllClose(gs.shape(result), gs.shape(landmarks_ab))
 
+    @geomstats.tests.np_and_tf_only
+    def test_l2_metric_geodesic_vectorization(self):
+        """Test the geodesic method of L2Metric with several landmark sets."""
+        landmarks_ab, landmarks_bc = self._landmarks_ab_and_bc()
+
+        expected = self.l2_metric_s2.geodesic(
+            self.landmarks_b, self.landmarks_c)(self.times)
+        self.assertAllClose(
+            gs.shape(landmarks_ab),
+            (self.n_landmark_sets, self.n_sampling_points, 3))
+        self.assertAllClose(landmarks_bc, expected)
+
     @geomstats.tests.np_and_tf_only
     def test_l2_metric_geodesic(self):
         """Test the geodesic method of L2Metric."""
@@ -154,12 +162,8 @@ class TestLandmarks(geomstats.tests.TestCase):
         landmarks_ab = landmarks_ab(self.times)
 
         result = landmarks_ab
-        expected = []
-        for k in range(self.n_sampling_points):
-            geod = self.l2_metric_s2.ambient_metric.geodesic(
-                initial_point=self.landmarks_a[k, :],
-                end_point=self.landmarks_b[k, :])
-            expected.append(geod(self.times))
-        expected = gs.stack(expected, axis=1)
+        geod = self.l2_metric_s2.ambient_metric.geodesic(
+            initial_point=self.landmarks_a, end_point=self.landmarks_b)
+        expected = gs.transpose(geod(self.times), (1, 0, 2))
 
         self.assertAllClose(result, expected)
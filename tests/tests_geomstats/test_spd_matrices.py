@@ -7,7 +7,7 @@ import tests.helper as helper
 
 import geomstats.backend as gs
 import geomstats.tests
-from geomstats.geometry.matrices import MatricesMetric
+from geomstats.geometry.matrices import Matrices, MatricesMetric
 from geomstats.geometry.spd_matrices import (
     SPDMatrices,
     SPDMetricAffine,
@@ -17,23 +17,53 @@ from geomstats.geometry.spd_matrices import (
 )
 
 
+BASE_POINT_BLOCK = gs.array([[1., 0., 0.],
+                             [0., 2.5, 1.5],
+                             [0., 1.5, 2.5]])
+TANGENT_VEC_RANK_ONE = gs.array([[2., 1., 1.],
+                                 [1., .5, .5],
+                                 [1., .5, .5]])
+DIFFERENTIAL_SQRT_RANK_ONE = gs.array([[1., 1 / 3, 1 / 3],
+                                       [1 / 3, .125, .125],
+                                       [1 / 3, .125, .125]])
+BASE_POINT_DIAG = gs.array([[1., 0., 0.],
+                            [0., 1., 0.],
+                            [0., 0., 4.]])
+TANGENT_VEC_AT_DIAG = gs.array([[1., 1., 3.],
+                                [1., 1., 3.],
+                                [3., 3., 4.]])
+SYMMETRIC_BASE_POINT = gs.array([[1., 0., 0.],
+                                 [0., 1., 0.],
+                                 [0., 0., -1.]])
+POINT_A = gs.array([[5., 0., 0.],
+                    [0., 7., 2.],
+                    [0., 2., 8.]])
+POINT_B = gs.array([[9., 0., 0.],
+                    [0., 5., 0.],
+                    [0., 0., 1.]])
+
+
 class TestSPDMatrices(geomstats.tests.TestCase):
     """Test of SPDMatrices methods."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the spaces and metrics shared by all tests."""
+        super(TestSPDMatrices, cls).setUpClass()
+        cls.n = 3
+        cls.space = SPDMatrices(n=cls.n)
+        cls.metric_affine = SPDMetricAffine(n=cls.n)
+        cls.metric_bureswasserstein = SPDMetricBuresWasserstein(n=cls.n)
+        cls.metric_euclidean = SPDMetricEuclidean(n=cls.n)
+        cls.metric_logeuclidean = SPDMetricLogEuclidean(n=cls.n)
+        cls.n_samples = 4
+
     def setUp(self):
         """Set up the test."""
         warnings.simplefilter('ignore', category=ImportWarning)
 
         gs.random.seed(1234)
 
-        self.n = 3
-        self.space = SPDMatrices(n=self.n)
-        self.metric_affine = SPDMetricAffine(n=self.n)
-        self.metric_bureswasserstein = SPDMetricBuresWasserstein(n=self.n)
-        self.metric_euclidean = SPDMetricEuclidean(n=self.n)
-        self.metric_logeuclidean = SPDMetricLogEuclidean(n=self.n)
-        self.n_samples = 4
-
     def test_belongs(self):
         """Test of belongs method."""
         mats = gs.array(
@@ -74,8 +104,8 @@ class TestSPDMatrices(geomstats.tests.TestCase):
         """Test of random_point and belongs methods."""
         points = self.space.random_point(4)
         result = self.space.belongs(points)
-        expected = gs.array([True] * 4)
-        self.assertAllClose(result, expected)
+        self.assertAllClose(gs.shape(result), (4,))
+        self.assertTrue(gs.all(result))
 
     def test_vector_from_symmetric_matrix_and_symmetric_matrix_from_vector(
             self):
@@ -131,48 +161,62 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_differential_power(self):
         """Test of differential_power method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 2.5, 1.5],
-                               [0., 1.5, 2.5]])
-        tangent_vec = gs.array([[2., 1., 1.],
-                               [1., .5, .5],
-                               [1., .5, .5]])
+        base_point = BASE_POINT_BLOCK
+        tangent_vec = TANGENT_VEC_RANK_ONE
         power = .5
         result = self.space.differential_power(
             power=power,
             tangent_vec=tangent_vec,
             base_point=base_point)
-        expected = gs.array([[1., 1 / 3, 1 / 3],
-                             [1 / 3, .125, .125],
-                             [1 / 3, .125, .125]])
+        expected = DIFFERENTIAL_SQRT_RANK_ONE
+        self.assertAllClose(result, expected)
+
+    def test_differential_power_repeated_eigenvalues(self):
+        """Test of differential_power at a point with a double eigenvalue."""
+        base_point = gs.array([[3., 1., 1.],
+                               [1., 3., 1.],
+                               [1., 1., 3.]])
+        tangent_vec = gs.array([[1., 2., 0.],
+                                [2., -1., 3.],
+                                [0., 3., 2.]])
+        sqrt_base_point = self.space.powerm(base_point, .5)
+        differential = self.space.differential_power(
+            .5, tangent_vec, base_point)
+        result = Matrices.mul(sqrt_base_point, differential) + Matrices.mul(
+            differential, sqrt_base_point)
+        self.assertAllClose(result, tangent_vec)
+
+    def test_differential_log_small_eigenvalues(self):
+        """Test of differential_log at small, well-separated eigenvalues."""
+        base_point = gs.array([[1e-13, 0., 0.],
+                               [0., 5e-13, 0.],
+                               [0., 0., 1.]])
+        tangent_vec = gs.array([[1., 1., 0.],
+                                [1., 1., 0.],
+                                [0., 0., 1.]])
+        result = self.space.differential_log(tangent_vec, base_point)
+        off_diag = math.log(5.) / 4e-13
+        expected = gs.array([[1e13, off_diag, 0.],
+                             [off_diag, 2e12, 0.],
+                             [0., 0., 1.]])
         self.assertAllClose(result, expected)
 
     def test_inverse_differential_power(self):
         """Test of inverse_differential_power method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 2.5, 1.5],
-                               [0., 1.5, 2.5]])
-        tangent_vec = gs.array([[1., 1 / 3, 1 / 3],
-                                [1 / 3, .125, .125],
-                                [1 / 3, .125, .125]])
+        base_point = BASE_POINT_BLOCK
+        tangent_vec = DIFFERENTIAL_SQRT_RANK_ONE
         power = .5
         result = self.space.inverse_differential_power(
             power=power,
             tangent_vec=tangent_vec,
             base_point=base_point)
-        expected = gs.array([[2., 1., 1.],
-                             [1., .5, .5],
-                             [1., .5, .5]])
+        expected = TANGENT_VEC_RANK_ONE
         self.assertAllClose(result, expected)
 
     def test_differential_log(self):
         """Test of differential_log method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 1., 0.],
-                               [0., 0., 4.]])
-        tangent_vec = gs.array([[1., 1., 3.],
-                                [1., 1., 3.],
-                                [3., 3., 4.]])
+        base_point = BASE_POINT_DIAG
+        tangent_vec = TANGENT_VEC_AT_DIAG
         result = self.space.differential_log(tangent_vec, base_point)
         x = 2 * gs.log(2.)
         expected = gs.array([[1., 1., x],
@@ -183,24 +227,18 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_inverse_differential_log(self):
         """Test of inverse_differential_log method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 1., 0.],
-                               [0., 0., 4.]])
+        base_point = BASE_POINT_DIAG
         x = 2 * gs.log(2.)
         tangent_vec = gs.array([[1., 1., x],
                                 [1., 1., x],
                                 [x, x, 1]])
         result = self.space.inverse_differential_log(tangent_vec, base_point)
-        expected = gs.array([[1., 1., 3.],
-                             [1., 1., 3.],
-                             [3., 3., 4.]])
+        expected = TANGENT_VEC_AT_DIAG
         self.assertAllClose(result, expected)
 
     def test_differential_exp(self):
         """Test of differential_exp method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 1., 0.],
-                               [0., 0., -1.]])
+        base_point = SYMMETRIC_BASE_POINT
         tangent_vec = gs.array([[1., 1., 1.],
                                 [1., 1., 1.],
                                 [1., 1., 1.]])
@@ -215,9 +253,7 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_inverse_differential_exp(self):
         """Test of inverse_differential_exp method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 1., 0.],
-                               [0., 0., -1.]])
+        base_point = SYMMETRIC_BASE_POINT
         x = gs.exp(1.)
         y = gs.sinh(1.)
         tangent_vec = gs.array([[x, x, y],
@@ -229,14 +265,38 @@ class TestSPDMatrices(geomstats.tests.TestCase):
                              [1., 1., 1.]])
         self.assertAllClose(result, expected)
 
+    def test_differential_and_inverse_with_eigh(self):
+        """Test of differential methods with a precomputed eigh."""
+        base_point = BASE_POINT_BLOCK
+        tangent_vec = TANGENT_VEC_RANK_ONE
+        eigh = gs.linalg.eigh(base_point)
+
+        result = self.space.differential_power(
+            .5, tangent_vec, base_point, eigh)
+        expected = self.space.differential_power(.5, tangent_vec, base_point)
+        self.assertAllClose(result, expected)
+        result = self.space.inverse_differential_power(
+            .5, result, base_point, eigh)
+        self.assertAllClose(result, tangent_vec)
+
+        result = self.space.differential_log(tangent_vec, base_point, eigh)
+        expected = self.space.differential_log(tangent_vec, base_point)
+        self.assertAllClose(result, expected)
+        result = self.space.inverse_differential_log(result, base_point, eigh)
+        self.assertAllClose(result, tangent_vec)
+
+        result = self.space.differential_exp(tangent_vec, base_point, eigh)
+        expected = self.space.differential_exp(tangent_vec, base_point)
+        self.assertAllClose(result, expected)
+        result = self.space.inverse_differential_exp(result, base_point, eigh)
+        self.assertAllClose(result, tangent_vec)
+
     def test_bureswasserstein_inner_product(self):
         """Test of SPDMetricBuresWasserstein.inner_product method."""
         base_point = gs.array([[1., 0., 0.],
                                [0., 1.5, .5],
                                [0., .5, 1.5]])
-        tangent_vec_a = gs.array([[2., 1., 1.],
-                                  [1., .5, .5],
-                                  [1., .5, .5]])
+        tangent_vec_a = TANGENT_VEC_RANK_ONE
         tangent_vec_b = gs.array([[1., 2., 4.],
                                   [2., 3., 8.],
                                   [4., 8., 5.]])
@@ -248,12 +308,8 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_power_affine_inner_product(self):
         """Test of SPDMetricAffine.inner_product method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 2.5, 1.5],
-                               [0., 1.5, 2.5]])
-        tangent_vec = gs.array([[2., 1., 1.],
-                               [1., .5, .5],
-                               [1., .5, .5]])
+        base_point = BASE_POINT_BLOCK
+        tangent_vec = TANGENT_VEC_RANK_ONE
         metric = SPDMetricAffine(3, power_affine=.5)
         result = metric.inner_product(tangent_vec, tangent_vec, base_point)
         expected = 713 / 144
@@ -262,12 +318,8 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_power_euclidean_inner_product(self):
         """Test of SPDMetricEuclidean.inner_product method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 2.5, 1.5],
-                               [0., 1.5, 2.5]])
-        tangent_vec = gs.array([[2., 1., 1.],
-                                [1., .5, .5],
-                                [1., .5, .5]])
+        base_point = BASE_POINT_BLOCK
+        tangent_vec = TANGENT_VEC_RANK_ONE
         metric = SPDMetricEuclidean(3, power_euclidean=.5)
         result = metric.inner_product(tangent_vec, tangent_vec, base_point)
         expected = 3472 / 576
@@ -297,12 +349,8 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_log_euclidean_inner_product(self):
         """Test of SPDMetricLogEuclidean.inner_product method."""
-        base_point = gs.array([[1., 0., 0.],
-                               [0., 1., 0.],
-                               [0., 0., 4.]])
-        tangent_vec = gs.array([[1., 1., 3.],
-                                [1., 1., 3.],
-                                [3., 3., 4.]])
+        base_point = BASE_POINT_DIAG
+        tangent_vec = TANGENT_VEC_AT_DIAG
         metric = self.metric_logeuclidean
         result = metric.inner_product(tangent_vec, tangent_vec, base_point)
         x = 2 * gs.log(2.)
@@ -310,67 +358,21 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
-    def test_log_and_exp_affine_invariant(self):
-        """Test of SPDMetricAffine.log and exp methods with power=1."""
-        base_point = gs.array([[5., 0., 0.],
-                               [0., 7., 2.],
-                               [0., 2., 8.]])
-        point = gs.array([[9., 0., 0.],
-                          [0., 5., 0.],
-                          [0., 0., 1.]])
-
-        metric = self.metric_affine
-        log = metric.log(point=point, base_point=base_point)
-        result = metric.exp(tangent_vec=log, base_point=base_point)
-        expected = point
-
-        self.assertAllClose(result, expected)
-
-    def test_log_and_exp_power_affine(self):
-        """Test of SPDMetricAffine.log and exp methods with power!=1."""
-        base_point = gs.array([[5., 0., 0.],
-                               [0., 7., 2.],
-                               [0., 2., 8.]])
-        point = gs.array([[9., 0., 0.],
-                          [0., 5., 0.],
-                          [0., 0., 1.]])
-        metric = SPDMetricAffine(3, power_affine=.5)
-        log = metric.log(point, base_point)
-        result = metric.exp(log, base_point)
+    def test_log_and_exp(self):
+        """Test of log and exp methods for all SPD metrics."""
+        base_point = POINT_A
+        point = POINT_B
         expected = point
-        self.assertAllClose(result, expected)
 
-    def test_log_and_exp_bureswasserstein(self):
-        """Test of SPDMetricBuresWasserstein.log and exp methods."""
-        base_point = gs.array([[5., 0., 0.],
-                               [0., 7., 2.],
-                               [0., 2., 8.]])
-        point = gs.array([[9., 0., 0.],
-                          [0., 5., 0.],
-                          [0., 0., 1.]])
-
-        metric = self.metric_bureswasserstein
-        log = metric.log(point=point, base_point=base_point)
-        result = metric.exp(tangent_vec=log, base_point=base_point)
-        expected = point
-
-        self.assertAllClose(result, expected)
-
-    def test_log_and_exp_logeuclidean(self):
-        """Test of SPDMetricLogEuclidean.log and exp methods."""
-        base_point = gs.array([[5., 0., 0.],
-                               [0., 7., 2.],
-                               [0., 2., 8.]])
-        point = gs.array([[9., 0., 0.],
-                          [0., 5., 0.],
-                          [0., 0., 1.]])
-
-        metric = self.metric_logeuclidean
-        log = metric.log(point=point, base_point=base_point)
-        result = metric.exp(tangent_vec=log, base_point=base_point)
-        expected = point
-
-        self.assertAllClose(result, expected)
+        metrics = [
+            self.metric_affine,
+            SPDMetricAffine(3, power_affine=.5),
+            self.metric_bureswasserstein,
+            self.metric_logeuclidean]
+        for metric in metrics:
+            log = metric.log(point=point, base_point=base_point)
+            result = metric.exp(tangent_vec=log, base_point=base_point)
+            self.assertAllClose(result, expected)
 
     def test_exp_and_belongs(self):
         """Test of SPDMetricAffine.exp with power=1 and belongs methods."""
@@ -381,9 +383,24 @@ class TestSPDMatrices(geomstats.tests.TestCase):
         metric = self.metric_affine
         exps = metric.exp(tangent_vec, base_point)
         result = self.space.belongs(exps)
-        expected = gs.array([True] * n_samples)
+        self.assertAllClose(gs.shape(result), (n_samples,))
+        self.assertTrue(gs.all(result))
 
-        self.assertAllClose(result, expected)
+    def test_log_and_exp_affine_invariant_float32(self):
+        """Test that SPDMetricAffine.log and exp preserve float32 inputs."""
+        base_point = gs.cast(POINT_A, gs.float32)
+        point = gs.cast(POINT_B, gs.float32)
+
+        metric = self.metric_affine
+        log = metric.log(point=point, base_point=base_point)
+        result = metric.exp(tangent_vec=log, base_point=base_point)
+        self.assertEqual(log.dtype, gs.float32)
+        self.assertEqual(result.dtype, gs.float32)
+        self.assertAllClose(result, point, atol=1e-5)
+
+        tangent_vec = self.space.random_tangent_vec(
+            n_samples=self.n_samples, base_point=base_point)
+        self.assertEqual(tangent_vec.dtype, gs.float32)
 
     def test_exp_vectorization(self):
         """Test of SPDMetricAffine.exp with power=1 and vectorization."""
@@ -412,11 +429,11 @@ class TestSPDMatrices(geomstats.tests.TestCase):
     def test_log_vectorization(self):
         """Test of SPDMetricAffine.log with power 1 and vectorization."""
         n_samples = self.n_samples
-        one_base_point = self.space.random_point(n_samples=1)
-        n_base_point = self.space.random_point(n_samples=n_samples)
-
-        one_point = self.space.random_point(n_samples=1)
-        n_point = self.space.random_point(n_samples=n_samples)
+        pool = self.space.random_point(n_samples=2 * n_samples)
+        n_base_point = pool[:n_samples]
+        n_point = pool[n_samples:]
+        one_base_point = n_base_point[0]
+        one_point = n_point[0]
         metric = self.metric_affine
 
         # Test with different points, one base point
@@ -453,14 +470,37 @@ class TestSPDMatrices(geomstats.tests.TestCase):
         result = self.space.belongs(points)
         self.assertTrue(gs.all(result))
 
+    def test_geodesic_vectorization(self):
+        """Test of SPDMetricAffine.geodesic with one initial point."""
+        n_samples = self.n_samples
+        initial_point = self.space.random_point()
+        initial_tangent_vecs = self.space.random_tangent_vec(
+            n_samples=n_samples, base_point=initial_point)
+        metric = self.metric_affine
+        geodesic = metric.geodesic(
+            initial_point=initial_point,
+            initial_tangent_vec=initial_tangent_vecs)
+
+        n_points = 10
+        t = gs.linspace(start=0., stop=1., num=n_points)
+        result = geodesic(t)
+        expected = gs.stack([
+            metric.geodesic(initial_point, initial_tangent_vec=vec)(t)
+            for vec in initial_tangent_vecs])
+        self.assertAllClose(
+            gs.shape(result), (n_samples, n_points, self.n, self.n))
+        self.assertAllClose(result, expected)
+
     def test_squared_dist_is_symmetric(self):
         """Test of SPDMetricAffine.squared_dist (power=1) and is_symmetric."""
         n_samples = self.n_samples
 
-        point_1 = self.space.random_point(n_samples=1)
-        point_2 = self.space.random_point(n_samples=1)
-        point_1 = gs.cast(point_1, gs.float64)
-        point_2 = gs.cast(point_2, gs.float64)
+        pool = self.space.random_point(n_samples=2 * n_samples + 2)
+        pool = gs.cast(pool, gs.float64)
+        point_1 = pool[0]
+        point_2 = pool[1]
+        n_point_1 = pool[2:2 + n_samples]
+        n_point_2 = pool[2 + n_samples:]
 
         metric = self.metric_affine
 
@@ -469,56 +509,42 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
         self.assertAllClose(sq_dist_1_2, sq_dist_2_1)
 
-        point_2 = self.space.random_point(n_samples=n_samples)
-        point_2 = gs.cast(point_2, gs.float64)
-
-        sq_dist_1_2 = metric.squared_dist(point_1, point_2)
-        sq_dist_2_1 = metric.squared_dist(point_2, point_1)
+        sq_dist_1_2 = metric.squared_dist(point_1, n_point_2)
+        sq_dist_2_1 = metric.squared_dist(n_point_2, point_1)
         self.assertAllClose(sq_dist_1_2, sq_dist_2_1)
 
-        point_1 = self.space.random_point(n_samples=n_samples)
-        point_2 = self.space.random_point(n_samples=1)
-        point_1 = gs.cast(point_1, gs.float64)
-        point_2 = gs.cast(point_2, gs.float64)
-
-        sq_dist_1_2 = metric.squared_dist(point_1, point_2)
-        sq_dist_2_1 = metric.squared_dist(point_2, point_1)
+        sq_dist_1_2 = metric.squared_dist(n_point_1, point_2)
+        sq_dist_2_1 = metric.squared_dist(point_2, n_point_1)
 
         self.assertAllClose(sq_dist_1_2, sq_dist_2_1)
 
-        sq_dist_1_2 = metric.squared_dist(point_1, point_2)
-        sq_dist_2_1 = metric.squared_dist(point_2, point_1)
+        sq_dist_1_2 = metric.squared_dist(n_point_1, n_point_2)
+        sq_dist_2_1 = metric.squared_dist(n_point_2, n_point_1)
 
         self.assertAllClose(sq_dist_1_2, sq_dist_2_1)
 
     def test_squared_dist_vectorization(self):
         """Test of SPDMetricAffine.squared_dist (power=1) and vectorization."""
         n_samples = self.n_samples
-        point_1 = self.space.random_point(n_samples=n_samples)
-        point_2 = self.space.random_point(n_samples=n_samples)
+        pool = self.space.random_point(n_samples=2 * n_samples)
+        n_point_1 = pool[:n_samples]
+        n_point_2 = pool[n_samples:]
+        point_1 = n_point_1[0]
+        point_2 = n_point_2[0]
 
         metric = self.metric_affine
-        result = metric.squared_dist(point_1, point_2)
+        result = metric.squared_dist(n_point_1, n_point_2)
 
         self.assertAllClose(gs.shape(result), (n_samples,))
 
-        point_1 = self.space.random_point(n_samples=1)
-        point_2 = self.space.random_point(n_samples=n_samples)
-
-        result = metric.squared_dist(point_1, point_2)
+        result = metric.squared_dist(point_1, n_point_2)
 
         self.assertAllClose(gs.shape(result), (n_samples,))
 
-        point_1 = self.space.random_point(n_samples=n_samples)
-        point_2 = self.space.random_point(n_samples=1)
-
-        result = metric.squared_dist(point_1, point_2)
+        result = metric.squared_dist(n_point_1, point_2)
 
         self.assertAllClose(gs.shape(result), (n_samples,))
 
-        point_1 = self.space.random_point(n_samples=1)
-        point_2 = self.space.random_point(n_samples=1)
-
         result = metric.squared_dist(point_1, point_2)
 
         self.assertAllClose(gs.shape(result), ())
@@ -546,12 +572,8 @@ class TestSPDMatrices(geomstats.tests.TestCase):
 
     def test_squared_dist_bureswasserstein(self):
         """Test of SPDMetricBuresWasserstein.squared_dist method."""
-        point_a = gs.array([[5., 0., 0.],
-                            [0., 7., 2.],
-                            [0., 2., 8.]])
-        point_b = gs.array([[9., 0., 0.],
-                            [0., 5., 0.],
-                            [0., 0., 1.]])
+        point_a = POINT_A
+        point_b = POINT_B
 
         metric = self.metric_bureswasserstein
         result = metric.squared_dist(point_a, point_b)
@@ -564,9 +586,7 @@ class TestSPDMatrices(geomstats.tests.TestCase):
     def test_squared_dist_bureswasserstein_vectorization(self):
         """Test of SPDMetricBuresWasserstein.squared_dist method."""
         point_a = self.space.random_point(2)
-        point_b = gs.array([[9., 0., 0.],
-                            [0., 5., 0.],
-                            [0., 0., 1.]])
+        point_b = POINT_B
 
         point_a = gs.cast(point_a, gs.float64)
         point_b = gs.cast(point_b, gs.float64)
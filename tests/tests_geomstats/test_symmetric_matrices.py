@@ -124,6 +124,42 @@ class TestSymmetricMatrices(geomstats.tests.TestCase):
         expected = gs.array([[1., 2., 3.], [2., 4., 5.], [3., 5., 6.]])
         self.assertAllClose(result, expected)
 
+    def test_symmetric_matrix_from_vector_other_dims(self):
+        """Test vector to matrix conversions for n different from 3."""
+        vector = gs.array([1., 2., 3.])
+        result = SymmetricMatrices(2).from_vector(vector)
+        expected = gs.array([[1., 2.], [2., 3.]])
+        self.assertAllClose(result, expected)
+
+        vector = gs.array([1., 2., 3., 4., 5., 6., 7., 8., 9., 10.])
+        result = SymmetricMatrices(4).from_vector(vector)
+        expected = gs.array([[1., 2., 3., 4.],
+                             [2., 5., 6., 7.],
+                             [3., 6., 8., 9.],
+                             [4., 7., 9., 10.]])
+        self.assertAllClose(result, expected)
+
+    def test_vector_and_symmetric_matrix_other_dims(self):
+        """Test round trips between vectors and matrices for n = 2, 4."""
+        n_samples = 5
+        for n in [2, 4]:
+            space = SymmetricMatrices(n)
+            vector = gs.random.rand(n_samples, n * (n + 1) // 2)
+            result = space.to_vector(space.from_vector(vector))
+            self.assertAllClose(result, vector)
+
+            sym_mat = space.from_vector(vector)
+            result = space.from_vector(space.to_vector(sym_mat))
+            self.assertAllClose(result, sym_mat)
+
+    def test_symmetric_matrix_from_vector_dtype(self):
+        """Test that from_vector returns the requested dtype."""
+        vector = gs.array([1., 2., 3., 4., 5., 6.])
+        result = self.space.from_vector(vector, dtype=gs.float64)
+        self.assertEqual(result.dtype, gs.float64)
+        result = self.space.from_vector(vector, dtype=gs.float32)
+        self.assertEqual(result.dtype, gs.float32)
+
     def test_projection_and_belongs(self):
         shape = (2, self.n, self.n)
         result = helper.test_projection_and_belongs(self.space, shape)